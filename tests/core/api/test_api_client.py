@@ -5,7 +5,13 @@ from pydantic import BaseModel
 from pytest_mock import MockerFixture
 from pathlib import Path
 
-from tiddl.core.api.client import TidalClient, ApiError
+from tiddl.core.api.client import (
+    TidalClient,
+    ApiError,
+    RETRY_DELAY,
+    RETRY_MAX_DELAY,
+    get_retry_delay,
+)
 
 
 def test_tidal_client_init(mocker: MockerFixture):
@@ -91,3 +97,77 @@ def test_fetch_error_raises_api_error(mocker: MockerFixture, tmp_path: Path):
 
     with pytest.raises(ApiError):
         client.fetch(DummyModel, "bad/endpoint")
+
+
+def test_fetch_refreshes_expired_token_once(mocker: MockerFixture, tmp_path: Path):
+    expired_response = mocker.Mock()
+    expired_response.status_code = 401
+    expired_response.request.headers = {"Authorization": "Bearer token"}
+
+    ok_response = mocker.Mock()
+    ok_response.status_code = 200
+    ok_response.from_cache = False
+    ok_response.json.return_value = {"foo": "bar"}
+
+    # the second request was sent with the old token before it got refreshed
+    mock_session = mocker.Mock()
+    mock_session.get.side_effect = [
+        expired_response,
+        ok_response,
+        expired_response,
+        ok_response,
+    ]
+
+    on_token_expiry = mocker.Mock(return_value="new-token")
+
+    client = TidalClient("token", tmp_path / "cache", on_token_expiry=on_token_expiry)
+    client.session = mock_session
+
+    assert client.fetch(DummyModel, "albums/1").foo == "bar"
+    assert client.fetch(DummyModel, "albums/2").foo == "bar"
+
+    on_token_expiry.assert_called_once()
+    assert client.token == "new-token"
+
+
+@pytest.mark.parametrize("status_code", [429, 503])
+def test_fetch_retries_transient_errors(
+    mocker: MockerFixture, tmp_path: Path, status_code: int
+):
+    mock_sleep = mocker.patch("tiddl.core.api.client.sleep")
+
+    error_response = mocker.Mock()
+    error_response.status_code = status_code
+    error_response.from_cache = False
+    error_response.headers = {}
+
+    ok_response = mocker.Mock()
+    ok_response.status_code = 200
+    ok_response.from_cache = False
+    ok_response.json.return_value = {"foo": "bar"}
+
+    mock_session = mocker.Mock()
+    mock_session.get.side_effect = [error_response, error_response, ok_response]
+
+    client = TidalClient("token", tmp_path / "cache")
+    client.session = mock_session
+
+    result = client.fetch(DummyModel, "albums/123")
+
+    assert result.foo == "bar"
+    assert mock_session.get.call_count == 3
+    assert mock_sleep.call_count == 2
+
+
+def test_get_retry_delay(mocker: MockerFixture):
+    response = mocker.Mock()
+
+    response.headers = {"Retry-After": "7"}
+    assert get_retry_delay(response, attempt=1) == 7
+
+    response.headers = {"Retry-After": "3600"}
+    assert get_retry_delay(response, attempt=1) == RETRY_MAX_DELAY
+
+    response.headers = {}
+    assert RETRY_DELAY <= get_retry_delay(response, attempt=1) <= RETRY_DELAY + 1
+    assert get_retry_delay(response, attempt=10) <= RETRY_MAX_DELAY + 1
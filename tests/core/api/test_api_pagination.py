@@ -0,0 +1,52 @@
+import asyncio
+
+from tiddl.core.api.models.base import Items
+from tiddl.core.api.pagination import fetch_pages
+
+
+def test_fetch_pages():
+    calls: list[tuple[int, int]] = []
+
+    def fetch_page(limit: int, offset: int):
+        calls.append((limit, offset))
+        return Items(limit=limit, offset=offset, totalNumberOfItems=250)
+
+    pages = asyncio.run(fetch_pages(fetch_page, limit=100))
+
+    assert [page.offset for page in pages] == [0, 100, 200]
+    assert sorted(calls) == [(100, 0), (100, 100), (100, 200)]
+
+
+def test_fetch_pages_single_page():
+    calls: list[int] = []
+
+    def fetch_page(limit: int, offset: int):
+        calls.append(offset)
+        return Items(limit=limit, offset=offset, totalNumberOfItems=20)
+
+    pages = asyncio.run(fetch_pages(fetch_page, limit=100))
+
+    assert len(pages) == 1
+    assert calls == [0]
+
+
+def test_fetch_pages_known_total():
+    calls: list[int] = []
+
+    def fetch_page(limit: int, offset: int):
+        calls.append(offset)
+        return Items(limit=limit, offset=offset, totalNumberOfItems=250)
+
+    pages = asyncio.run(fetch_pages(fetch_page, limit=100, total=250))
+
+    assert [page.offset for page in pages] == [0, 100, 200]
+    assert sorted(calls) == [0, 100, 200]
+
+
+def test_fetch_pages_stale_total():
+    def fetch_page(limit: int, offset: int):
+        return Items(limit=limit, offset=offset, totalNumberOfItems=250)
+
+    pages = asyncio.run(fetch_pages(fetch_page, limit=100, total=150))
+
+    assert [page.offset for page in pages] == [0, 100, 200]
@@ -0,0 +1,101 @@
+import sys
+import pytest
+import subprocess
+
+from pytest_mock import MockerFixture
+from pathlib import Path
+
+from tiddl.core.utils.ffmpeg import (
+    FFMPEG_TIMEOUT,
+    FFMPEG_TIMEOUT_PER_MIB,
+    convert_to_mp4,
+    extract_flac,
+    get_timeout,
+    is_ffmpeg_installed,
+    run,
+)
+
+
+def test_run_detaches_streams(mocker: MockerFixture):
+    mock_run = mocker.patch("tiddl.core.utils.ffmpeg.subprocess.run")
+
+    run(["ffmpeg", "-version"])
+
+    mock_run.assert_called_once_with(
+        ["ffmpeg", "-version"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        timeout=FFMPEG_TIMEOUT,
+        check=True,
+    )
+
+
+def test_run_timeout():
+    with pytest.raises(subprocess.TimeoutExpired):
+        run([sys.executable, "-c", "import time; time.sleep(5)"], timeout=0.1)
+
+
+def test_is_ffmpeg_installed(mocker: MockerFixture):
+    mock_which = mocker.patch(
+        "tiddl.core.utils.ffmpeg.shutil.which", return_value="/usr/bin/ffmpeg"
+    )
+    mock_run = mocker.patch("tiddl.core.utils.ffmpeg.subprocess.run")
+
+    assert is_ffmpeg_installed()
+    mock_which.assert_called_once_with("ffmpeg")
+    mock_run.assert_not_called()
+
+    mock_which.return_value = None
+
+    assert not is_ffmpeg_installed()
+
+
+def test_get_timeout_scales_with_size(tmp_path: Path):
+    source = tmp_path / "video.ts"
+    source.write_bytes(b"0" * 2**21)
+
+    assert get_timeout(source) == FFMPEG_TIMEOUT + 2 * FFMPEG_TIMEOUT_PER_MIB
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        subprocess.TimeoutExpired("ffmpeg", 1),
+        subprocess.CalledProcessError(1, "ffmpeg"),
+    ],
+)
+def test_convert_to_mp4_removes_partial_output(
+    mocker: MockerFixture, tmp_path: Path, error: Exception
+):
+    source = tmp_path / "video.ts"
+    source.write_bytes(b"stream")
+
+    def fail(cmd: list[str], **kwargs):
+        Path(cmd[-1]).write_bytes(b"partial")
+        raise error
+
+    mocker.patch("tiddl.core.utils.ffmpeg.subprocess.run", side_effect=fail)
+
+    with pytest.raises(type(error)):
+        convert_to_mp4(source)
+
+    assert not (tmp_path / "video.mp4").exists()
+    assert source.exists()
+
+
+def test_extract_flac_removes_partial_output(mocker: MockerFixture, tmp_path: Path):
+    source = tmp_path / "track.m4a"
+    source.write_bytes(b"stream")
+
+    def fail(cmd: list[str], **kwargs):
+        Path(cmd[-1]).write_bytes(b"partial")
+        raise subprocess.TimeoutExpired("ffmpeg", 1)
+
+    mocker.patch("tiddl.core.utils.ffmpeg.subprocess.run", side_effect=fail)
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        extract_flac(source)
+
+    assert not (tmp_path / "track.tmp.flac").exists()
+    assert not (tmp_path / "track.flac").exists()
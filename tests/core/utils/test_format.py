@@ -0,0 +1,19 @@
+import pytest
+
+from tiddl.core.utils.format import _clean_segment
+
+
+@pytest.mark.parametrize(
+    "segment, expected",
+    [
+        ("Title", "Title"),
+        ("Vol.. 2...", "Vol. 2"),
+        ("a   b", "a b"),
+        ("name. ", "name"),
+        ('AC/DC: "Live"', "ACDC Live"),
+        ("...", "_"),
+        ("", "_"),
+    ],
+)
+def test_clean_segment(segment: str, expected: str):
+    assert _clean_segment(segment) == expected
@@ -0,0 +1,54 @@
+import json
+
+from base64 import b64encode
+
+from tiddl.core.api.models import TrackStream
+from tiddl.core.utils.parse import parse_manifest_XML, parse_track_stream
+
+MANIFEST = """<?xml version="1.0" encoding="UTF-8"?>
+<MPD xmlns="urn:mpeg:dash:schema:mpd:2011">
+  <Period>
+    <AdaptationSet>
+      <Representation codecs="flac">
+        <SegmentTemplate media="https://example.com/$Number$.mp4">
+          <SegmentTimeline>
+            <S d="1" r="2"/>
+            <S d="1"/>
+          </SegmentTimeline>
+        </SegmentTemplate>
+      </Representation>
+    </AdaptationSet>
+  </Period>
+</MPD>
+"""
+
+
+def test_parse_manifest_xml():
+    urls, codecs = parse_manifest_XML(MANIFEST)
+
+    assert codecs == "flac"
+    assert urls == [f"https://example.com/{i}.mp4" for i in range(0, 5)]
+
+
+def test_parse_track_stream_bts():
+    manifest = {
+        "mimeType": "audio/flac",
+        "codecs": "flac",
+        "encryptionType": "NONE",
+        "urls": ["https://example.com/track.flac"],
+    }
+
+    track_stream = TrackStream(
+        trackId=1,
+        assetPresentation="FULL",
+        audioMode="STEREO",
+        audioQuality="LOSSLESS",
+        manifestMimeType="application/vnd.tidal.bts",
+        manifestHash="",
+        manifest=b64encode(json.dumps(manifest).encode()).decode(),
+    )
+
+    urls, file_extension = parse_track_stream(track_stream)
+
+    assert urls == ["https://example.com/track.flac"]
+    assert file_extension == ".flac"
@@ -0,0 +1,16 @@
+import pytest
+
+from tiddl.core.utils.sanitize import sanitize_string
+
+
+@pytest.mark.parametrize(
+    "string, expected",
+    [
+        ("Artist - Title", "Artist - Title"),
+        ('AC/DC: "Live" <1991>?', "ACDC Live 1991"),
+        ("a\\b|c*d", "abcd"),
+        ("Żółć ★", "Żółć ★"),
+    ],
+)
+def test_sanitize_string(string: str, expected: str):
+    assert sanitize_string(string) == expected
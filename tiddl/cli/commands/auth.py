@@ -56,9 +56,9 @@ def login():
             except AuthClientError as e:
                 if e.error == "authorization_pending":
                     time_left = auth_end_at - time()
-                    minutes, seconds = time_left // 60, int(time_left % 60)
+                    minutes, seconds = divmod(int(time_left), 60)
                     status.update(
-                        f"{status_text} time left: {minutes:.0f}:{seconds:02d}"
+                        f"{status_text} time left: {minutes}:{seconds:02d}"
                     )
                     continue
 
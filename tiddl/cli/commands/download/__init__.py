@@ -2,6 +2,9 @@ import os
 import typer
 import asyncio
 
+from collections import OrderedDict
+from functools import partial
+from dataclasses import dataclass, field
 from pathlib import Path
 from logging import getLogger
 from rich.live import Live
@@ -10,6 +13,8 @@ from typing_extensions import Annotated
 
 from tiddl.core.metadata import add_track_metadata, add_video_metadata, Cover
 from tiddl.core.api import ApiError
+from tiddl.core.api.api import Limits
+from tiddl.core.api.pagination import MAX_CONCURRENT_PAGES, fetch_pages
 from tiddl.core.api.models import Album, Track, Video, AlbumItemsCredits
 from tiddl.core.utils.format import format_template
 from tiddl.core.utils.m3u import save_tracks_to_m3u
@@ -35,6 +40,8 @@ register_subcommands(download_command)
 
 log = getLogger(__name__)
 
+COVERS_CACHE_SIZE = 32
+
 
 @download_command.callback(no_args_is_help=True)
 def download_callback(
@@ -152,7 +159,12 @@ def download_callback(
             if path and isinstance(track, Track)
         ]
 
-        log.debug(f"{resource_type=}, {filename=}, {len(tracks_with_existing_paths)=}")
+        log.debug(
+            "resource_type=%r, filename=%r, len(tracks_with_existing_paths)=%r",
+            resource_type,
+            filename,
+            len(tracks_with_existing_paths),
+        )
 
         save_tracks_to_m3u(
             tracks_with_path=tracks_with_existing_paths, path=DOWNLOAD_PATH / filename
@@ -181,6 +193,13 @@ def download_callback(
         return predict_item_quality().upper()
 
     async def download_resources():
+        # `asyncio.to_thread` calls reuse one pool instead of the loop default,
+        # sized for a stream lookup and a tagging call per download thread
+        # next to concurrent page fetches
+        asyncio.get_running_loop().set_default_executor(
+            ctx.obj.get_executor(max_workers=THREADS_COUNT * 2 + MAX_CONCURRENT_PAGES)
+        )
+
         rich_output = RichOutput(ctx.obj.console)
 
         downloader = Downloader(
@@ -195,20 +214,72 @@ def download_callback(
             scan_path=SCAN_PATH,
         )
 
+        albums: dict[str, asyncio.Task[Album]] = {}
+
+        async def get_album(album_id: int | str) -> Album:
+            # playlists and mixes often contain many tracks from the same album,
+            # resource ids are strings while item album ids are ints
+            key = str(album_id)
+
+            if key not in albums:
+                albums[key] = asyncio.create_task(
+                    asyncio.to_thread(ctx.obj.api.get_album, album_id)
+                )
+
+            try:
+                return await albums[key]
+            except Exception:
+                # let the next item retry instead of reusing the error
+                albums.pop(key, None)
+                raise
+
+        covers: OrderedDict[tuple[str, int], Cover] = OrderedDict()
+        cover_fetches: dict[Cover, asyncio.Task[bytes]] = {}
+
+        def get_cover(uid: str, size: int = 1280) -> Cover:
+            # share fetched cover data between tracks of recent albums
+            key = (uid, size)
+
+            if key not in covers:
+                covers[key] = Cover(uid, size=size)
+
+            cover = covers[key]
+            covers.move_to_end(key)
+
+            if len(covers) > COVERS_CACHE_SIZE:
+                # evicting a cover that is still downloading would fetch it again
+                for old_key, old_cover in covers.items():
+                    if old_key != key and old_cover not in cover_fetches:
+                        del covers[old_key]
+                        break
+
+            return cover
+
+        async def fetch_cover(cover: Cover) -> None:
+            # `b""` marks a failed download, try again for this item
+            if cover.data:
+                return
+
+            # tracks sharing a cover wait for the same request
+            if cover not in cover_fetches:
+                cover_fetches[cover] = asyncio.create_task(
+                    asyncio.to_thread(cover.fetch_data)
+                )
+
+            try:
+                await cover_fetches[cover]
+            finally:
+                cover_fetches.pop(cover, None)
+
+        @dataclass(slots=True)
         class Metadata:
-            def __init__(
-                self,
-                date: str = "",
-                artist: str = "",
-                credits: list[AlbumItemsCredits.ItemWithCredits.CreditsEntry] = [],
-                cover: Cover | None = None,
-                album_review: str = "",
-            ) -> None:
-                self.date = date
-                self.artist = artist
-                self.credits = credits
-                self.cover = cover
-                self.album_review = album_review
+            date: str = ""
+            artist: str = ""
+            credits: list[AlbumItemsCredits.ItemWithCredits.CreditsEntry] = field(
+                default_factory=list
+            )
+            cover: Cover | None = None
+            album_review: str = ""
 
         async def handle_resource(resource: TidalResource):
             async def handle_item(
@@ -216,7 +287,7 @@ def download_callback(
                 file_path: str,
                 track_metadata: Metadata | None = None,
             ) -> tuple[Path | None, Track | Video]:
-                log.debug(f"{item.id=}, {file_path=}")
+                log.debug("item.id=%r, file_path=%r", item.id, file_path)
                 rich_output.total_increment()
 
                 if not track_metadata:
@@ -226,7 +297,9 @@ def download_callback(
                     item=item, file_path=Path(file_path)
                 )
 
-                log.debug(f"{download_path=}, {was_downloaded=}")
+                log.debug(
+                    "download_path=%r, was_downloaded=%r", download_path, was_downloaded
+                )
 
                 if (
                     CONFIG.metadata.enable
@@ -239,9 +312,10 @@ def download_callback(
 
                         if CONFIG.metadata.lyrics:
                             try:
-                                lyrics_subtitles = ctx.obj.api.get_track_lyrics(
-                                    item.id
-                                ).subtitles
+                                lyrics = await asyncio.to_thread(
+                                    ctx.obj.api.get_track_lyrics, item.id
+                                )
+                                lyrics_subtitles = lyrics.subtitles
                             except Exception as e:
                                 log.error(e)
 
@@ -250,12 +324,14 @@ def download_callback(
                             and item.album.cover
                             and CONFIG.metadata.cover
                         ):
-                            track_metadata.cover = Cover(item.album.cover)
+                            track_metadata.cover = get_cover(item.album.cover)
 
-                        if track_metadata.cover and track_metadata.cover.data is None:
-                            track_metadata.cover.fetch_data()
+                        if track_metadata.cover:
+                            await fetch_cover(track_metadata.cover)
 
-                        add_track_metadata(
+                        # tagging rewrites the file, keep it off the event loop
+                        await asyncio.to_thread(
+                            add_track_metadata,
                             path=download_path,
                             track=item,
                             lyrics=lyrics_subtitles,
@@ -271,7 +347,9 @@ def download_callback(
                         )
 
                     elif isinstance(item, Video):
-                        add_video_metadata(path=download_path, video=item)
+                        await asyncio.to_thread(
+                            add_video_metadata, path=download_path, video=item
+                        )
 
                 if download_path and CONFIG.download.update_mtime:
                     try:
@@ -282,30 +360,32 @@ def download_callback(
                 return download_path, item
 
             async def download_album(album: Album):
-                offset = 0
                 futures = []
 
                 cover: Cover | None = None
                 save_cover = ("album" in CONFIG.cover.allowed) and CONFIG.cover.save
 
                 if album.cover and (CONFIG.metadata.cover or save_cover):
-                    cover = Cover(album.cover, size=CONFIG.cover.size)
+                    cover = get_cover(album.cover, size=CONFIG.cover.size)
 
                 album_review = ""
 
                 if CONFIG.metadata.album_review:
                     try:
-                        album_review = ctx.obj.api.get_album_review(
-                            album_id=resource.id
-                        ).normalized_text()
+                        review = await asyncio.to_thread(
+                            ctx.obj.api.get_album_review, album_id=resource.id
+                        )
+                        album_review = review.normalized_text()
                     except Exception as e:
                         log.error(e)
 
-                while True:
-                    album_items = ctx.obj.api.get_album_items_credits(
-                        album_id=album.id, offset=offset
-                    )
+                album_pages = await fetch_pages(
+                    partial(ctx.obj.api.get_album_items_credits, album.id),
+                    limit=Limits.ALBUM_ITEMS_MAX,
+                    total=album.numberOfTracks + album.numberOfVideos,
+                )
 
+                for album_items in album_pages:
                     for album_item in album_items.items:
                         try:
                             template = TEMPLATE or CONFIG.templates.album
@@ -339,23 +419,19 @@ def download_callback(
                             )
                         except ApiError as e:
                             item = album_item.item
-                            track_info = f"Track: {getattr(item, 'title', 'Unknown')} (ID: {item.id})"
-                            if hasattr(item, 'album') and item.album:
+                            track_info = f"Track: {item.title} (ID: {item.id})"
+                            if item.album:
                                 track_info += f", Album ID: {item.album.id}"
                             ctx.obj.console.print(f"[red]API Error:[/] {e} ({track_info})")
                             if not SKIP_ERRORS:
                                 raise
                         except Exception as e:
                             item = album_item.item
-                            track_info = f"Track: {getattr(item, 'title', 'Unknown')} (ID: {item.id})"
+                            track_info = f"Track: {item.title} (ID: {item.id})"
                             ctx.obj.console.print(f"[red]Error:[/] {e} ({track_info})")
                             if not SKIP_ERRORS:
                                 raise
 
-                    offset += album_items.limit
-                    if offset >= album_items.totalNumberOfItems:
-                        break
-
                 tracks_with_path = await asyncio.gather(*futures)
 
                 save_m3u(
@@ -383,8 +459,8 @@ def download_callback(
             match resource.type:
 
                 case "track":
-                    track = ctx.obj.api.get_track(resource.id)
-                    album = ctx.obj.api.get_album(track.album.id)
+                    track = await asyncio.to_thread(ctx.obj.api.get_track, resource.id)
+                    album = await get_album(track.album.id)
 
                     await handle_item(
                         item=track,
@@ -401,7 +477,7 @@ def download_callback(
                         and ("track" in CONFIG.cover.allowed)
                         and track.album.cover
                     ):
-                        Cover(
+                        get_cover(
                             track.album.cover, size=CONFIG.cover.size
                         ).save_to_directory(
                             path=DOWNLOAD_PATH
@@ -411,11 +487,11 @@ def download_callback(
                         )
 
                 case "video":
-                    video = ctx.obj.api.get_video(resource.id)
+                    video = await asyncio.to_thread(ctx.obj.api.get_video, resource.id)
                     template = TEMPLATE or CONFIG.templates.video
 
                     if "{album" in template and video.album:
-                        album = ctx.obj.api.get_album(video.album.id)
+                        album = await get_album(video.album.id)
                     else:
                         album = None
 
@@ -430,20 +506,20 @@ def download_callback(
                     )
 
                 case "mix":
-                    offset = 0
                     futures = []
 
-                    while True:
-                        mix_items = ctx.obj.api.get_mix_items(resource.id, offset=0)
+                    mix_pages = await fetch_pages(
+                        partial(ctx.obj.api.get_mix_items, resource.id),
+                        limit=Limits.MIX_ITEMS_MAX,
+                    )
 
+                    for mix_items in mix_pages:
                         for mix_item in mix_items.items:
                             template = TEMPLATE or CONFIG.templates.mix
 
                             try:
                                 if "{album" in template:
-                                    album = ctx.obj.api.get_album(
-                                        mix_item.item.album.id
-                                    )
+                                    album = await get_album(mix_item.item.album.id)
                                 else:
                                     album = None
 
@@ -461,21 +537,17 @@ def download_callback(
                                 )
                             except ApiError as e:
                                 item = mix_item.item
-                                track_info = f"Track: {getattr(item, 'title', 'Unknown')} (ID: {item.id})"
+                                track_info = f"Track: {item.title} (ID: {item.id})"
                                 ctx.obj.console.print(f"[red]API Error:[/] {e} ({track_info})")
                                 if not SKIP_ERRORS:
                                     raise
                             except Exception as e:
                                 item = mix_item.item
-                                track_info = f"Track: {getattr(item, 'title', 'Unknown')} (ID: {item.id})"
+                                track_info = f"Track: {item.title} (ID: {item.id})"
                                 ctx.obj.console.print(f"[red]Error:[/] {e} ({track_info})")
                                 if not SKIP_ERRORS:
                                     raise
 
-                        offset += mix_items.limit
-                        if offset >= mix_items.totalNumberOfItems:
-                            break
-
                     tracks_with_path = await asyncio.gather(*futures)
 
                     save_m3u(
@@ -489,7 +561,7 @@ def download_callback(
                     )
 
                 case "album":
-                    album = ctx.obj.api.get_album(album_id=resource.id)
+                    album = await get_album(resource.id)
                     await download_album(album)
 
                 case "artist":
@@ -507,11 +579,12 @@ def download_callback(
                             if not SKIP_ERRORS:
                                 raise
 
-                    def get_all_albums(singles: bool):
+                    async def get_all_albums(singles: bool):
                         offset = 0
 
                         while True:
-                            artist_albums = ctx.obj.api.get_artist_albums(
+                            artist_albums = await asyncio.to_thread(
+                                ctx.obj.api.get_artist_albums,
                                 artist_id=resource.id,
                                 offset=offset,
                                 filter="EPSANDSINGLES" if singles else "ALBUMS",
@@ -524,12 +597,14 @@ def download_callback(
                             if offset >= artist_albums.totalNumberOfItems:
                                 break
 
-                    def get_all_videos():
+                    async def get_all_videos():
                         offset = 0
 
                         while True:
-                            artist_videos = ctx.obj.api.get_artist_videos(
-                                resource.id, offset=offset
+                            artist_videos = await asyncio.to_thread(
+                                ctx.obj.api.get_artist_videos,
+                                resource.id,
+                                offset=offset,
                             )
 
                             for video in artist_videos.items:
@@ -537,7 +612,7 @@ def download_callback(
 
                                 try:
                                     if "{album" in template and video.album:
-                                        album = ctx.obj.api.get_album(video.album.id)
+                                        album = await get_album(video.album.id)
                                     else:
                                         album = None
 
@@ -561,43 +636,43 @@ def download_callback(
                                     if not SKIP_ERRORS:
                                         raise
 
-                            if offset > artist_videos.totalNumberOfItems:
-                                break
-
                             offset += artist_videos.limit
+                            if offset >= artist_videos.totalNumberOfItems:
+                                break
 
                     if VIDEOS_FILTER != "none":
-                        get_all_videos()
+                        await get_all_videos()
 
                     if VIDEOS_FILTER != "only":
                         if SINGLES_FILTER == "include":
-                            get_all_albums(False)
-                            get_all_albums(True)
+                            await get_all_albums(False)
+                            await get_all_albums(True)
                         else:
-                            get_all_albums(SINGLES_FILTER == "only")
+                            await get_all_albums(SINGLES_FILTER == "only")
 
                     await asyncio.gather(*futures)
 
                 case "playlist":
-                    offset = 0
                     futures = []
                     playlist_index = 0
-                    playlist = ctx.obj.api.get_playlist(playlist_uuid=resource.id)
+                    playlist = await asyncio.to_thread(
+                        ctx.obj.api.get_playlist, playlist_uuid=resource.id
+                    )
 
-                    while True:
-                        playlist_items = ctx.obj.api.get_playlist_items(
-                            playlist_uuid=resource.id, offset=offset
-                        )
+                    playlist_pages = await fetch_pages(
+                        partial(ctx.obj.api.get_playlist_items, resource.id),
+                        limit=Limits.PLAYLIST_ITEMS_MAX,
+                        total=playlist.numberOfTracks + playlist.numberOfVideos,
+                    )
 
+                    for playlist_items in playlist_pages:
                         for playlist_item in playlist_items.items:
                             playlist_index += 1
                             template = TEMPLATE or CONFIG.templates.playlist
 
                             try:
                                 if "{album" in template:
-                                    album = ctx.obj.api.get_album(
-                                        playlist_item.item.album.id
-                                    )
+                                    album = await get_album(playlist_item.item.album.id)
                                 else:
                                     album = None
 
@@ -617,23 +692,19 @@ def download_callback(
                                 )
                             except ApiError as e:
                                 item = playlist_item.item
-                                track_info = f"Track: {getattr(item, 'title', 'Unknown')} (ID: {item.id})"
-                                if hasattr(item, 'album') and item.album:
+                                track_info = f"Track: {item.title} (ID: {item.id})"
+                                if item.album:
                                     track_info += f", Album ID: {item.album.id}"
                                 ctx.obj.console.print(f"[red]API Error:[/] {e} ({track_info})")
                                 if not SKIP_ERRORS:
                                     raise
                             except Exception as e:
                                 item = playlist_item.item
-                                track_info = f"Track: {getattr(item, 'title', 'Unknown')} (ID: {item.id})"
+                                track_info = f"Track: {item.title} (ID: {item.id})"
                                 ctx.obj.console.print(f"[red]Error:[/] {e} ({track_info})")
                                 if not SKIP_ERRORS:
                                     raise
 
-                        offset += playlist_items.limit
-                        if offset >= playlist_items.totalNumberOfItems:
-                            break
-
                     tracks_with_path = await asyncio.gather(*futures)
 
                     save_m3u(
@@ -663,7 +734,7 @@ def download_callback(
 
         with Live(
             rich_output.group,
-            refresh_per_second=10,
+            refresh_per_second=4,
             console=ctx.obj.console,
             transient=True,
         ):
@@ -680,7 +751,10 @@ def download_callback(
                     if not SKIP_ERRORS:
                         raise
 
-            await asyncio.gather(*(wrapper(r) for r in ctx.obj.resources))
+            try:
+                await asyncio.gather(*(wrapper(r) for r in ctx.obj.resources))
+            finally:
+                await downloader.close()
 
         rich_output.show_stats()
 
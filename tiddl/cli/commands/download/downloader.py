@@ -50,6 +50,7 @@ class Downloader:
     skip_existing: bool
     download_path: Path
     scan_path: Path
+    _session: aiohttp.ClientSession | None
 
     def __init__(
         self,
@@ -72,6 +73,23 @@ class Downloader:
         self.skip_existing = skip_existing
         self.download_path = download_path
         self.scan_path = scan_path
+        self._session = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        Session shared by all downloads,
+        so connections to the media servers are kept alive between items.
+        """
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
 
     async def download(
         self, item: Track | Video, file_path: Path
@@ -102,7 +120,12 @@ class Downloader:
 
         existing_file_path = self.scan_path / filename
 
-        log.debug(f"{file_path=}, {filename=}, {existing_file_path=}")
+        log.debug(
+            "file_path=%r, filename=%r, existing_file_path=%r",
+            file_path,
+            filename,
+            existing_file_path,
+        )
 
         result_message = "[green]Downloaded"
 
@@ -120,7 +143,9 @@ class Downloader:
         elif (isinstance(item, Video) and self.videos_filter == "none") or (
             isinstance(item, Track) and self.videos_filter == "only"
         ):
-            log.debug(f"skipping {item.id} due to {self.videos_filter=}")
+            log.debug(
+                "skipping %s due to self.videos_filter=%r", item.id, self.videos_filter
+            )
             self.rich_output.console.print(
                 f"Skipping '{item.title}' due to video filter set to '{self.videos_filter}'"
             )
@@ -131,8 +156,10 @@ class Downloader:
         async with self.semaphore:
             if isinstance(item, Track):
                 try:
-                    stream = self.api.get_track_stream(
-                        track_id=item.id, quality=self.track_quality
+                    stream = await asyncio.to_thread(
+                        self.api.get_track_stream,
+                        track_id=item.id,
+                        quality=self.track_quality,
                     )
                 except ApiError as e:
                     log.error(f"{item.id=} {e=}")
@@ -153,8 +180,10 @@ class Downloader:
                     should_extract_flac = True
 
             elif isinstance(item, Video):
-                stream = self.api.get_video_stream(
-                    video_id=item.id, quality=self.video_quality
+                stream = await asyncio.to_thread(
+                    self.api.get_video_stream,
+                    video_id=item.id,
+                    quality=self.video_quality,
                 )
 
                 urls, ext = parse_video_stream(stream), ".ts"
@@ -167,23 +196,19 @@ class Downloader:
 
             download_path.parent.mkdir(exist_ok=True, parents=True)
 
-            # TODO shouldnt session be reused instead of
-            # creating new one on every download?
-
             with NamedTemporaryFile(
                 "wb", delete=False, dir=download_path.parent
             ) as tmp:
-                async with aiohttp.ClientSession() as session:
-                    async with aiofiles.open(tmp.name, "wb") as f:
-                        for url in urls:
-                            async with session.get(url) as resp:
-                                async for chunk in resp.content.iter_chunked(
-                                    CHUNK_SIZE
-                                ):
-                                    await f.write(chunk)
-                                    self.rich_output.download_advance(
-                                        task_id, size=len(chunk)
-                                    )
+                async with aiofiles.open(tmp.name, "wb") as f:
+                    for url in urls:
+                        async with self.session.get(url) as resp:
+                            async for chunk in resp.content.iter_chunked(
+                                CHUNK_SIZE
+                            ):
+                                await f.write(chunk)
+                                self.rich_output.download_advance(
+                                    task_id, size=len(chunk)
+                                )
 
             shutil.move(tmp.name, download_path)
 
@@ -194,6 +219,9 @@ class Downloader:
                     download_path = convert_to_mp4(download_path)
             except Exception as exc:
                 log.error(f"{should_extract_flac=}, {exc=}")
+                self.rich_output.console.print(
+                    f"[red]Error [{vibrant_color}]{item.title}[/] - ffmpeg failed, kept {download_path.name}"
+                )
 
             task = self.rich_output.download_finish(
                 task_id=task_id,
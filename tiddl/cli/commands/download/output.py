@@ -76,7 +76,9 @@ class RichOutput:
         return self.download_progress.add_task(description=description, total=None)
 
     def download_advance(self, task_id: TaskID, size: float):
-        self.download_progress.update(task_id=task_id, advance=size, refresh=True)
+        # the surrounding Live redraws on its own cadence, a forced refresh
+        # here would re-render both panels for every downloaded chunk
+        self.download_progress.update(task_id=task_id, advance=size)
 
     def download_finish(self, task_id: TaskID) -> Task:
         task = self.download_progress._tasks.get(task_id)
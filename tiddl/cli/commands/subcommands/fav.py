@@ -27,17 +27,19 @@ def fav(
     """
 
     favorites = ctx.obj.api.get_favorites()
-    favorites_dict = favorites.model_dump()
 
     stats: dict[ResourceTypeLiteral, int] = dict()
 
     for resource_type in cast(list[ResourceTypeLiteral], TYPES):
-        resources = favorites_dict[resource_type.upper()]
+        # read ids straight from the model, dumping it would copy every list
+        resources: list[str] = getattr(favorites, resource_type.upper())
 
         stats[resource_type] = len(resources)
 
-        for resource_id in resources:
-            ctx.obj.resources.append(TidalResource(id=resource_id, type=resource_type))
+        ctx.obj.resources.extend(
+            TidalResource(id=resource_id, type=resource_type)
+            for resource_id in resources
+        )
 
     ctx.obj.console.print(f"[green]Loaded {len(ctx.obj.resources)} resources")
 
@@ -1,6 +1,7 @@
 import typer
 from time import time
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 from rich.console import Console
 
@@ -18,6 +19,7 @@ class ContextObject:
     _api: TidalAPI | None
     api_omit_cache: bool
     debug_path: Path | None
+    _executor: ThreadPoolExecutor | None
 
     def __init__(
         self, api_omit_cache: bool, debug_path: Path | None, console: Console
@@ -28,6 +30,17 @@ class ContextObject:
         self._api = None
         self.api_omit_cache = api_omit_cache
         self.debug_path = debug_path
+        self._executor = None
+
+    def get_executor(self, max_workers: int) -> ThreadPoolExecutor:
+        """Thread pool for blocking calls offloaded with `asyncio.to_thread`."""
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="tiddl-api"
+            )
+
+        return self._executor
 
     @property
     def api(self):
@@ -12,7 +12,7 @@ log = getLogger(__name__)
 
 
 def load_auth_data(file: Path = AUTH_DATA_FILE) -> AuthData:
-    log.debug(f"loading from '{AUTH_DATA_FILE}'")
+    log.debug("loading from '%s'", file)
 
     try:
         file_content = file.read_text()
@@ -25,7 +25,7 @@ def load_auth_data(file: Path = AUTH_DATA_FILE) -> AuthData:
 
 
 def save_auth_data(auth_data: AuthData, file: Path = AUTH_DATA_FILE):
-    log.debug(f"saving to '{file}'")
+    log.debug("saving to '%s'", file)
 
     with file.open("w") as f:
         f.write(auth_data.model_dump_json())
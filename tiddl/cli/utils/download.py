@@ -21,6 +21,12 @@ def get_existing_track_filename(
 
     full_file_name = file_name.with_suffix(extension)
 
-    log.debug(f"{track_quality=}, {download_quality=}, {file_name=}, {full_file_name=}")
+    log.debug(
+        "track_quality=%r, download_quality=%r, file_name=%r, full_file_name=%r",
+        track_quality,
+        download_quality,
+        file_name,
+        full_file_name,
+    )
 
     return full_file_name
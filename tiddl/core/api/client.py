@@ -4,8 +4,11 @@ from pathlib import Path
 from typing import Any, Type, TypeVar, Callable, Optional
 
 from pydantic import BaseModel
+from random import uniform
+from threading import Lock
 from time import sleep
 
+from requests import Response
 from requests.exceptions import JSONDecodeError
 from requests_cache import (
     CachedSession,
@@ -20,10 +23,26 @@ T = TypeVar("T", bound=BaseModel)
 API_URL = "https://api.tidal.com/v1"
 MAX_RETRIES = 5
 RETRY_DELAY = 2
+RETRY_MAX_DELAY = 30
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
 
 log = getLogger(__name__)
 
 
+def get_retry_delay(res: Response, attempt: int) -> float:
+    """
+    Exponential backoff with jitter.
+    Honors the `Retry-After` header when server sends it in seconds.
+    """
+
+    retry_after = res.headers.get("Retry-After", "")
+
+    if retry_after.isdigit():
+        return min(float(retry_after), RETRY_MAX_DELAY)
+
+    return min(RETRY_DELAY * 2 ** (attempt - 1), RETRY_MAX_DELAY) + uniform(0, 1)
+
+
 # TODO add token expiry check
 # maybe refactor to aiohttp.ClientSession
 class TidalClient:
@@ -31,6 +50,7 @@ class TidalClient:
     debug_path: Path | None
     session: CachedSession
     on_token_expiry: Optional[Callable[[], str | None]]
+    _token_lock: Lock
 
     def __init__(
         self,
@@ -50,6 +70,7 @@ class TidalClient:
             "Accept": "application/json",
         }
         self._token = token
+        self._token_lock = Lock()
 
     @property
     def token(self):
@@ -82,10 +103,13 @@ class TidalClient:
         )
 
         if res.status_code == 401 and self.on_token_expiry:
-            token = self.on_token_expiry()
+            # fetch runs from worker threads, refresh the token only once
+            with self._token_lock:
+                if res.request.headers.get("Authorization") == f"Bearer {self.token}":
+                    token = self.on_token_expiry()
 
-            if token:
-                self.token = token
+                    if token:
+                        self.token = token
 
             return self.fetch(
                 model=model,
@@ -96,9 +120,34 @@ class TidalClient:
             )
 
         log.debug(
-            f"{endpoint} {params} '{'HIT' if res.from_cache else 'MISS'}' [{res.status_code}]",
+            "%s %s '%s' [%s]",
+            endpoint,
+            params,
+            "HIT" if res.from_cache else "MISS",
+            res.status_code,
         )
 
+        if res.status_code in RETRY_STATUS_CODES and _attempt < MAX_RETRIES:
+            delay = get_retry_delay(res, _attempt)
+
+            log.warning(
+                "%s [%s], retrying %d/%d in %.1fs",
+                endpoint,
+                res.status_code,
+                _attempt,
+                MAX_RETRIES,
+                delay,
+            )
+            sleep(delay)
+
+            return self.fetch(
+                model=model,
+                endpoint=endpoint,
+                params=params,
+                expire_after=expire_after,
+                _attempt=_attempt + 1,
+            )
+
         try:
             data = res.json()
         except JSONDecodeError as e:
@@ -0,0 +1,47 @@
+import asyncio
+from typing import Callable, TypeVar
+
+from .models.base import Items
+
+T = TypeVar("T", bound=Items)
+
+MAX_CONCURRENT_PAGES = 4
+
+
+async def fetch_pages(
+    fetch_page: Callable[..., T],
+    limit: int,
+    total: int | None = None,
+    max_concurrency: int = MAX_CONCURRENT_PAGES,
+) -> list[T]:
+    """
+    Fetch every page of a paginated resource.
+
+    `fetch_page` is called with `limit` and `offset` keyword arguments.
+    When `total` is already known (e.g. from `Playlist.numberOfTracks`)
+    all pages are fetched concurrently, otherwise the first page is fetched
+    alone to learn `totalNumberOfItems`. Pages are returned in offset order.
+    """
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(offset: int) -> T:
+        async with semaphore:
+            return await asyncio.to_thread(fetch_page, limit=limit, offset=offset)
+
+    async def fetch_range(start: int, stop: int) -> list[T]:
+        return await asyncio.gather(
+            *(fetch(offset) for offset in range(start, stop, limit))
+        )
+
+    if total is None:
+        pages = await fetch_range(0, 1)
+    else:
+        pages = await fetch_range(0, max(total, 1))
+
+    # pick up items that were added after `total` was read
+    pages.extend(
+        await fetch_range(len(pages) * limit, pages[0].totalNumberOfItems)
+    )
+
+    return pages
@@ -7,6 +7,8 @@ log = getLogger(__name__)
 
 
 class Cover:
+    __slots__ = ("uid", "url", "data")
+
     uid: str
     url: str
     data: bytes | None
@@ -34,7 +36,7 @@ class Cover:
             self.data = b""
             return b""
 
-        log.debug(f"got cover data of {self.url}")
+        log.debug("got cover data of %s", self.url)
 
         self.data = req.content
 
@@ -44,7 +46,7 @@ class Cover:
         file = path.with_suffix(".jpg")
 
         if file.exists():
-            log.debug(f"cover exists ({file})")
+            log.debug("cover exists (%s)", file)
             return
 
         if not self.data:
@@ -5,12 +5,9 @@ from .parse import parse_track_stream, parse_video_stream
 
 
 def download(urls: list[str]) -> bytes:
+    # joining once avoids copying the whole buffer on every segment
     with Session() as s:
-        stream_data = b""
-
-        for url in urls:
-            req = s.get(url)
-            stream_data += req.content
+        stream_data = b"".join(s.get(url).content for url in urls)
 
     return stream_data
 
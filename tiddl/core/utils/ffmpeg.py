@@ -1,26 +1,67 @@
+import shutil
 import subprocess
 from pathlib import Path
 
+FFMPEG_TIMEOUT = 300
+# extra seconds per MiB of input, remuxing large videos on slow storage takes a while
+FFMPEG_TIMEOUT_PER_MIB = 1
 
-def run(cmd: list[str]):
-    """Run process without printing to terminal"""
-    subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def run(cmd: list[str], timeout: float | None = FFMPEG_TIMEOUT):
+    """
+    Run process without printing to terminal.
+
+    Raises `subprocess.TimeoutExpired` and kills the process
+    when it does not finish in `timeout` seconds,
+    `subprocess.CalledProcessError` when it exits with an error.
+    """
+
+    # ffmpeg reads commands from stdin and stalls when it is not detached
+    subprocess.run(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        timeout=timeout,
+        check=True,
+    )
 
 
 def is_ffmpeg_installed() -> bool:
     """Checks if `ffmpeg` is installed."""
 
+    # runs on every cli call, look up PATH instead of spawning ffmpeg
+    return shutil.which("ffmpeg") is not None
+
+
+def get_timeout(source: Path) -> float:
+    """Timeout for processing `source`, scaled with its size."""
+
+    return FFMPEG_TIMEOUT + source.stat().st_size / 2**20 * FFMPEG_TIMEOUT_PER_MIB
+
+
+def copy_streams(source: Path, output: Path):
+    """
+    Copy streams of `source` into `output` without re-encoding.
+
+    Removes the partly written `output` when ffmpeg fails or times out,
+    otherwise it would be taken for an already downloaded file.
+    """
+
     try:
-        run(["ffmpeg", "-version"])
-        return True
-    except FileNotFoundError:
-        return False
+        run(
+            ["ffmpeg", "-y", "-i", str(source), "-c", "copy", str(output)],
+            timeout=get_timeout(source),
+        )
+    except Exception:
+        output.unlink(missing_ok=True)
+        raise
 
 
 def convert_to_mp4(source: Path) -> Path:
     output_path = source.with_suffix(".mp4")
 
-    run(["ffmpeg", "-y", "-i", str(source), "-c", "copy", str(output_path)])
+    copy_streams(source, output_path)
 
     source.unlink()
 
@@ -34,7 +75,7 @@ def extract_flac(source: Path) -> Path:
 
     tmp = source.with_suffix(".tmp.flac")
 
-    run(["ffmpeg", "-y", "-i", str(source), "-c", "copy", str(tmp)])
+    copy_streams(source, tmp)
 
     tmp.replace(source.with_suffix(".flac"))
 
@@ -1,11 +1,17 @@
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime
 
 from tiddl.core.api.models import Track, Video, Album, Playlist
 from tiddl.core.utils.sanitize import sanitize_string
 
+_MULTIPLE_DOTS = re.compile(r"\.{2,}")
+_MULTIPLE_SPACES = re.compile(r"\s{2,}")
 
+
+# artist and album segments repeat for every track of a resource
+@lru_cache(maxsize=4096)
 def _clean_segment(text: str) -> str:
     """
     Clean a single path segment using sanitize_string plus extra rules
@@ -19,15 +25,17 @@ def _clean_segment(text: str) -> str:
     """
 
     text = sanitize_string(text)
-    text = re.sub(r"\.{2,}", ".", text)
+    text = _MULTIPLE_DOTS.sub(".", text)
     text = text.rstrip(" .")
-    text = re.sub(r"\s{2,}", " ", text)
+    text = _MULTIPLE_SPACES.sub(" ", text)
     text = text.strip()
 
     return text or "_"
 
 
 class Explicit:
+    __slots__ = ("value",)
+
     def __init__(self, value: bool | None):
         self.value = value
 
@@ -58,6 +66,8 @@ class Explicit:
 
 
 class UserFormat:
+    __slots__ = ("value",)
+
     def __init__(self, value: bool) -> None:
         self.value = value
 
@@ -152,7 +162,7 @@ def generate_template_data(
             artists=", ".join(main_artists),
             features=", ".join(featured_artists),
             artists_with_features=", ".join(main_artists + featured_artists),
-            explicit=Explicit(getattr(item, "explicit", None)),
+            explicit=Explicit(item.explicit),
             dolby=dolby,
         )
 
@@ -166,7 +176,7 @@ def generate_template_data(
                 a.name for a in (album.artists or []) if a.type == "MAIN"
             ),
             date=album.releaseDate,
-            explicit=Explicit(getattr(album, "explicit", None)),
+            explicit=Explicit(album.explicit),
             master=UserFormat(
                 "HIRES_LOSSLESS" in album.mediaMetadata.tags and quality == "MAX"
             ),
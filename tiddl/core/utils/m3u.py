@@ -16,7 +16,7 @@ def save_tracks_to_m3u(
     """
 
     file = path.with_suffix(".m3u")
-    log.debug(f"{path=}, {file=}")
+    log.debug("path=%r, file=%r", path, file)
 
     if not tracks_with_path:
         log.warning(f"can't save '{file}', no tracks")
@@ -32,7 +32,9 @@ def save_tracks_to_m3u(
                     f"#EXTINF:{track.duration},{track.artist.name if track.artist else ''} - {track.title}\n{track_path}\n"
                 )
 
-            log.debug(f"saved m3u file as '{file}' with {len(tracks_with_path)} tracks")
+            log.debug(
+                "saved m3u file as '%s' with %d tracks", file, len(tracks_with_path)
+            )
 
     except Exception as e:
         log.error(f"can't save m3u file: {e}")
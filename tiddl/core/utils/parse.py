@@ -7,6 +7,18 @@ from xml.etree.ElementTree import fromstring
 from tiddl.core.api.models import TrackStream, VideoStream
 
 
+class TrackManifest(BaseModel):
+    mimeType: str
+    codecs: str
+    encryptionType: str
+    urls: list[str]
+
+
+class VideoManifest(BaseModel):
+    mimeType: str
+    urls: list[str]
+
+
 def parse_manifest_XML(xml_content: str):
     """
     Parses XML manifest file of the track.
@@ -36,12 +48,8 @@ def parse_manifest_XML(xml_content: str):
     if not timelineElements:
         raise ValueError("SegmentTimeline elements not found")
 
-    total = 0
-    for element in timelineElements:
-        total += 1
-        count = element.get("r")
-        if count is not None:
-            total += int(count)
+    # every <S> is one segment, repeated `r` more times
+    total = sum(1 + int(element.get("r", 0)) for element in timelineElements)
 
     urls = [url_template.replace("$Number$", str(i)) for i in range(0, total + 1)]
 
@@ -60,12 +68,6 @@ def parse_track_stream(track_stream: TrackStream) -> tuple[list[str], str]:
     | HI_RES_LOSSLESS | m4a        | application/dash+xml      | audio/mp4  |
     """
 
-    class TrackManifest(BaseModel):
-        mimeType: str
-        codecs: str
-        encryptionType: str
-        urls: list[str]
-
     decoded_manifest = b64decode(track_stream.manifest).decode()
 
     match track_stream.manifestMimeType:
@@ -91,10 +93,6 @@ def parse_track_stream(track_stream: TrackStream) -> tuple[list[str], str]:
 def parse_video_stream(video_stream: VideoStream) -> list[str]:
     """Parse `video_stream` manifest and return video urls"""
 
-    class VideoManifest(BaseModel):
-        mimeType: str
-        urls: list[str]
-
     decoded_manifest = b64decode(video_stream.manifest).decode()
     manifest = VideoManifest.model_validate_json(decoded_manifest)
 